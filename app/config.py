@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 40
+    DB_USE_NULL_POOL: bool = False  # 僅供一次性腳本於自身行程環境變數設定，勿寫入共用 .env
     
     # Redis (可選)
     REDIS_URL: Optional[str] = None
@@ -3,16 +3,25 @@
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from app.config import settings
 
+# 連線池設定（一次性腳本可透過 DB_USE_NULL_POOL 停用連線池）
+if settings.DB_USE_NULL_POOL:
+    _pool_options = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,  # 連線前檢測是否有效
+        "pool_recycle": 3600,   # 1小時回收連線
+    }
+
 # 建立異步引擎
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # 開發環境顯示 SQL
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,  # 連線前檢測是否有效
-    pool_recycle=3600,   # 1小時回收連線
+    **_pool_options,
 )
 
 # 建立 Session Factory
@@ -57,8 +57,9 @@ async def root():
 
 
 @app.get("/health")
+@app.head("/health", include_in_schema=False)
 async def health_check():
-    """健康檢查端點"""
+    """健康檢查端點（支援 HEAD，供輪詢探測使用）"""
     return {
         "status": "healthy",
         "app_name": settings.APP_NAME,
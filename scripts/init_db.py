@@ -12,7 +12,7 @@ from pathlib import Path
 # 添加專案根目錄到 Python 路徑
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import AsyncSessionLocal
 from app.models import Department, User, Category, UserRole
@@ -20,7 +20,7 @@ from app.core.security import get_password_hash
 
 
 async def init_departments(session: AsyncSession):
-    """初始化預設處室"""
+    """初始化預設處室（僅 flush，由呼叫端統一 commit）"""
     print("🏢 正在初始化處室...")
     
     departments_data = [
@@ -29,30 +29,34 @@ async def init_departments(session: AsyncSession):
         {"name": "總務處", "description": "負責行政總務、資產管理、採購等業務", "color": "#F59E0B"},
     ]
     
-    created_count = 0
-    for dept_data in departments_data:
-        # 檢查是否已存在
-        result = await session.execute(
-            select(Department).where(Department.name == dept_data["name"])
+    # 一次查詢所有已存在的處室
+    result = await session.execute(
+        select(Department.name).where(
+            Department.name.in_([d["name"] for d in departments_data])
         )
-        existing = result.scalar_one_or_none()
-        
-        if existing:
+    )
+    existing_names = set(result.scalars().all())
+    
+    rows = []
+    for dept_data in departments_data:
+        if dept_data["name"] in existing_names:
             print(f"  ⏭️  處室 '{dept_data['name']}' 已存在，跳過")
         else:
-            dept = Department(**dept_data)
-            session.add(dept)
-            created_count += 1
+            rows.append(dept_data)
             print(f"  ✅ 建立處室: {dept_data['name']} (顏色: {dept_data['color']})")
     
-    await session.commit()
+    if rows:
+        await session.execute(insert(Department), rows)
+    created_count = len(rows)
+    
+    await session.flush()
     print(f"✨ 處室初始化完成！建立 {created_count} 個處室\n")
     
     return departments_data
 
 
 async def init_categories(session: AsyncSession):
-    """初始化預設分類（每個處室獨立的分類）"""
+    """初始化預設分類（每個處室獨立的分類，僅 flush，由呼叫端統一 commit）"""
     print("📁 正在初始化分類...")
     
     # 取得所有處室
@@ -91,7 +95,15 @@ async def init_categories(session: AsyncSession):
         ],
     }
     
-    created_count = 0
+    # 一次查詢所有已存在的（處室, 分類名稱）組合
+    result = await session.execute(
+        select(Category.department_id, Category.name).where(
+            Category.department_id.in_([dept.id for dept in departments])
+        )
+    )
+    existing_keys = set(result.tuples().all())
+    
+    rows = []
     for dept in departments:
         dept_categories = categories_by_dept.get(dept.name, [])
         
@@ -102,34 +114,28 @@ async def init_categories(session: AsyncSession):
         print(f"  📂 處室 '{dept.name}' 的分類：")
         
         for cat_data in dept_categories:
-            # 檢查是否已存在（同處室同名稱）
-            result = await session.execute(
-                select(Category).where(
-                    Category.name == cat_data["name"],
-                    Category.department_id == dept.id
-                )
-            )
-            existing = result.scalar_one_or_none()
-            
-            if existing:
+            # 同處室同名稱視為已存在
+            if (dept.id, cat_data["name"]) in existing_keys:
                 print(f"     ⏭️  分類 '{cat_data['name']}' 已存在，跳過")
             else:
-                category = Category(
-                    name=cat_data["name"],
-                    description=cat_data["description"],
-                    color=cat_data["color"],
-                    department_id=dept.id
-                )
-                session.add(category)
-                created_count += 1
+                rows.append({
+                    "name": cat_data["name"],
+                    "description": cat_data["description"],
+                    "color": cat_data["color"],
+                    "department_id": dept.id,
+                })
                 print(f"     ✅ 建立分類: {cat_data['name']} (顏色: {cat_data['color']})")
     
-    await session.commit()
+    if rows:
+        await session.execute(insert(Category), rows)
+    created_count = len(rows)
+    
+    await session.flush()
     print(f"\n✨ 分類初始化完成！建立 {created_count} 個分類\n")
 
 
 async def init_admin_users(session: AsyncSession):
-    """初始化管理員帳號（系統管理員 + 各處室管理員）"""
+    """初始化管理員帳號（系統管理員 + 各處室管理員，僅 flush，由呼叫端統一 commit）"""
     print("👤 正在初始化管理員帳號...")
     
     # 從環境變數讀取管理員帳號密碼
@@ -156,35 +162,15 @@ async def init_admin_users(session: AsyncSession):
         print("  ❌ 錯誤：找不到人事室")
         return
     
-    print("  🔑 系統管理員：")
     super_admin_data = {
         "username": super_admin_username,
         "email": super_admin_email,
         "full_name": "系統管理員",
-        "hashed_password": get_password_hash(super_admin_password),
         "role": UserRole.SUPER_ADMIN,
         "is_active": True,
         "department_id": None,
     }
     
-    result = await session.execute(
-        select(User).where(User.username == super_admin_data["username"])
-    )
-    existing = result.scalar_one_or_none()
-    
-    if existing:
-        print(f"     ⏭️  '{super_admin_data['username']}' 已存在，跳過")
-    else:
-        admin = User(**super_admin_data)
-        session.add(admin)
-        print(f"     ✅ 建立: {super_admin_data['username']} (系統管理員)")
-        print(f"        📧 Email: {super_admin_data['email']}")
-        print(f"        🏢 處室: {hr_dept.name}")
-        print(f"        🔑 密碼: {super_admin_password}")
-    
-    # 2. 為每個處室建立處室管理員
-    print("\n  👥 處室管理員：")
-    
     dept_admins = [
         {
             "username": "hr_admin",
@@ -206,37 +192,64 @@ async def init_admin_users(session: AsyncSession):
         },
     ]
     
+    # 一次查詢所有已存在的帳號
+    usernames = [super_admin_data["username"]] + [a["username"] for a in dept_admins]
+    result = await session.execute(
+        select(User.username).where(User.username.in_(usernames))
+    )
+    existing_usernames = set(result.scalars().all())
+    
+    # 待建立的帳號：(資料列, 明文密碼)
+    pending = []
+    
+    print("  🔑 系統管理員：")
+    if super_admin_data["username"] in existing_usernames:
+        print(f"     ⏭️  '{super_admin_data['username']}' 已存在，跳過")
+    else:
+        pending.append((super_admin_data, super_admin_password))
+        print(f"     ✅ 建立: {super_admin_data['username']} (系統管理員)")
+        print(f"        📧 Email: {super_admin_data['email']}")
+        print(f"        🏢 處室: {hr_dept.name}")
+        print(f"        🔑 密碼: {super_admin_password}")
+    
+    # 2. 為每個處室建立處室管理員
+    print("\n  👥 處室管理員：")
+    
     for admin_data in dept_admins:
         dept = dept_map.get(admin_data["department"])
         if not dept:
             print(f"     ⚠️  找不到處室 '{admin_data['department']}'，跳過")
             continue
         
-        # 檢查是否已存在
-        result = await session.execute(
-            select(User).where(User.username == admin_data["username"])
-        )
-        existing = result.scalar_one_or_none()
-        
-        if existing:
+        if admin_data["username"] in existing_usernames:
             print(f"     ⏭️  '{admin_data['username']}' 已存在，跳過")
         else:
-            user = User(
-                username=admin_data["username"],
-                email=admin_data["email"],
-                full_name=admin_data["full_name"],
-                hashed_password=get_password_hash(dept_admin_password),
-                role=UserRole.ADMIN,
-                is_active=True,
-                department_id=dept.id,
-            )
-            session.add(user)
+            row = {
+                "username": admin_data["username"],
+                "email": admin_data["email"],
+                "full_name": admin_data["full_name"],
+                "role": UserRole.ADMIN,
+                "is_active": True,
+                "department_id": dept.id,
+            }
+            pending.append((row, dept_admin_password))
             print(f"     ✅ 建立: {admin_data['username']} (處室管理員)")
             print(f"        📧 Email: {admin_data['email']}")
             print(f"        🏢 處室: {dept.name}")
             print(f"        🔑 密碼: {dept_admin_password}")
     
-    await session.commit()
+    if pending:
+        # bcrypt 雜湊在執行緒中並行計算，再以單一 INSERT 寫入
+        hashed_passwords = await asyncio.gather(
+            *[asyncio.to_thread(get_password_hash, password) for _, password in pending]
+        )
+        rows = [
+            {**row, "hashed_password": hashed}
+            for (row, _), hashed in zip(pending, hashed_passwords)
+        ]
+        await session.execute(insert(User), rows)
+    
+    await session.flush()
     print(f"\n✨ 管理員初始化完成！\n")
 
 
@@ -258,6 +271,9 @@ async def main():
             # 3. 初始化管理員
             await init_admin_users(session)
             
+            # 一次提交所有初始化資料
+            await session.commit()
+            
             # 讀取環境變數以顯示正確的帳號資訊
             super_admin_username = os.getenv("SUPER_ADMIN_USERNAME", "superadmin")
             super_admin_password = os.getenv("SUPER_ADMIN_PASSWORD", "admin123")
@@ -290,5 +306,12 @@ if __name__ == "__main__":
     # Windows 平台修正
     if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        # POSIX 平台若有 uvloop（uvicorn[standard] 附帶）則使用
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     
     asyncio.run(main())
@@ -8,7 +8,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from app.core.database import AsyncSessionLocal
 from app.models import SystemSetting
 
@@ -128,27 +128,29 @@ async def init_system_settings():
     ]
     
     async with AsyncSessionLocal() as db:
-        created_count = 0
-        skipped_count = 0
+        # 一次查詢所有已存在的設定鍵
+        result = await db.execute(
+            select(SystemSetting.key).where(
+                SystemSetting.key.in_([s["key"] for s in default_settings])
+            )
+        )
+        existing_keys = set(result.scalars().all())
         
+        rows = []
         for setting_data in default_settings:
-            # 檢查設定是否已存在
-            result = await db.execute(
-                select(SystemSetting).where(SystemSetting.key == setting_data["key"])
-            )
-            existing_setting = result.scalar_one_or_none()
-            
-            if existing_setting:
+            if setting_data["key"] in existing_keys:
                 print(f"⏭️  跳過已存在的設定: {setting_data['key']}")
-                skipped_count += 1
                 continue
             
-            # 建立新設定
-            setting = SystemSetting(**setting_data)
-            db.add(setting)
-            created_count += 1
+            rows.append(setting_data)
             print(f"✅ 建立設定: {setting_data['key']}")
         
+        # 以單一 INSERT 建立所有新設定
+        if rows:
+            await db.execute(insert(SystemSetting), rows)
+        created_count = len(rows)
+        skipped_count = len(default_settings) - created_count
+        
         await db.commit()
         
         print(f"\n📊 設定初始化完成:")
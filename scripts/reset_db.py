@@ -11,54 +11,69 @@
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 
 # 添加專案根目錄到 Python 路徑
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text
+# 單次執行的腳本不需要連線池（可由環境變數覆寫）
+os.environ.setdefault("DB_USE_NULL_POOL", "true")
+
 from app.core.database import AsyncSessionLocal, engine
 from app.models import Base
 from scripts.init_db import init_departments, init_categories, init_admin_users
 from scripts.init_system_settings import init_system_settings
 
+SEPARATOR = "=" * 60
 
-async def drop_all_tables():
-    """刪除所有表格"""
-    print("🗑️  正在刪除所有表格...")
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
-    print("✅ 所有表格已刪除\n")
+START_BANNER = f"""{SEPARATOR}
+🔄 RAG 知識庫系統 - 資料庫重置與初始化
+{SEPARATOR}
+
+"""
+
+DONE_BANNER = f"""{SEPARATOR}
+🎉 資料庫重置與初始化完成！
+{SEPARATOR}
+
+📝 預設帳號資訊：
 
+   🔑 系統管理員：
+      帳號：superadmin
+      密碼：admin123
 
-async def create_all_tables():
-    """建立所有表格"""
-    print("🏗️  正在建立所有表格...")
+   👥 處室管理員：
+      人事室：hr_admin / admin123
+      會計室：acc_admin / admin123
+      總務處：ga_admin / admin123
+
+   ⚠️  請登入後立即修改密碼！
+
+"""
+
+
+async def recreate_all_tables():
+    """刪除並重新建立所有表格（同一個交易內完成）"""
+    print("🗑️  正在刪除並重新建立所有表格...")
     
     async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
     
-    print("✅ 所有表格已建立\n")
+    print("✅ 所有表格已重新建立\n")
 
 
 async def main():
     """執行重置與初始化"""
-    print("=" * 60)
-    print("🔄 RAG 知識庫系統 - 資料庫重置與初始化")
-    print("=" * 60)
-    print()
+    sys.stdout.write(START_BANNER)
     
     try:
-        # 1. 刪除所有表格
-        await drop_all_tables()
+        # 1. 刪除並重新建立所有表格
+        await recreate_all_tables()
         
-        # 2. 重新建立所有表格
-        await create_all_tables()
-        
-        # 3. 初始化預設資料
+        # 2. 初始化預設資料
         async with AsyncSessionLocal() as session:
             # 初始化處室
             await init_departments(session)
@@ -68,27 +83,14 @@ async def main():
             
             # 初始化管理員（系統管理員 + 處室管理員）
             await init_admin_users(session)
+            
+            # 一次提交所有初始化資料
+            await session.commit()
         
-        # 4. 初始化系統設定
+        # 3. 初始化系統設定
         await init_system_settings()
         
-        print("=" * 60)
-        print("🎉 資料庫重置與初始化完成！")
-        print("=" * 60)
-        print()
-        print("📝 預設帳號資訊：")
-        print()
-        print("   🔑 系統管理員：")
-        print("      帳號：superadmin")
-        print("      密碼：admin123")
-        print()
-        print("   👥 處室管理員：")
-        print("      人事室：hr_admin / admin123")
-        print("      會計室：acc_admin / admin123")
-        print("      總務處：ga_admin / admin123")
-        print()
-        print("   ⚠️  請登入後立即修改密碼！")
-        print()
+        sys.stdout.write(DONE_BANNER)
         
     except Exception as e:
         print(f"\n❌ 重置失敗：{e}")
@@ -101,5 +103,12 @@ if __name__ == "__main__":
     # Windows 平台修正
     if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        # POSIX 平台若有 uvloop（uvicorn[standard] 附帶）則使用
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     
     asyncio.run(main())